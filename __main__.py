@@ -1,13 +1,15 @@
-from lstore.db import Database
-from lstore.query import Query
-from time import perf_counter
-from random import choice, randrange, seed, randint
-
 from lstore.db import Database
 from lstore.query import Query, Index
+from bench_utils import ALL_COLUMNS, make_update_cols, mismatched_rows
 
-from random import choice, randint, sample, seed
-from shutil import rmtree
+from time import perf_counter_ns
+from random import choices, randrange, sample, seed
+from itertools import accumulate
+from array import array
+from operator import itemgetter
+from runpy import run_path
+from os import path
+import argparse
 
 def validate():
 	db = Database()
@@ -28,103 +30,99 @@ def validate():
 	#index.create_index(2)
 	#index.create_index(3)
 
-	# dictionary for records to test the database: test directory
-	records = {}
+	# expected rows, kept side by side with keys in insertion order
+	rows = []
 
 	number_of_records = 1000
 	number_of_aggregates = 100
+	# num_columns goes through the Rust table on every read, so read it once
+	ncols = grades_table.num_columns
 	seed(3562901)
 
-	for i in range(0, number_of_records):
-		key = 92106429 + randint(0, number_of_records)
+	# draw every grade up front instead of four randint calls per record
+	grades = choices(range(0, 21), k=number_of_records * 4)
+
+	# distinct keys in random order without retrying on duplicates; keys are
+	# packed 64-bit ints rather than boxed Python ints
+	keys = array('q', sample(range(92106429, 92106429 + number_of_records + 1), number_of_records))
 
-		#skip duplicate keys
-		while key in records:
-			key = 92106429 + randint(0, number_of_records)
+	for i, key in enumerate(keys):
+		rows.append([key, *grades[i * 4:i * 4 + 4]])
 
-		records[key] = [key, randint(0, 20), randint(0, 20), randint(0, 20), randint(0, 20)]
-		
-		query.insert(*records[key])
-		# print('inserted', records[key])
+	query.insert_many(rows)
 	print("Insert finished")
 
+	# key-sorted view of the same rows, used for the range aggregates
+	order = sorted(range(len(keys)), key=keys.__getitem__)
+	sorted_keys = array('q', (keys[i] for i in order))
+	sorted_rows = [rows[i] for i in order]
+
 	#db.close()
 	#exit()
-	# Check inserted records using select query
-	for key in records:
-		# select function will return array of records 
-		# here we are sure that there is only one record in t hat array
-		record = query.select(key, 0, [1, 1, 1, 1, 1])[0]
-		error = False
-		for i, column in enumerate(record.columns):
-			if column != records[key][i]:
-				error = True
-		if error:
-			print('select error on', key, ':', record, ', correct:', records[key])
-		else:
-			pass
-			# print('select on', key, ':', record)
+	# Check inserted records with one sequential scan; records were
+	# inserted in order, so the scan lines up with rows
+	scanned = query.scan_all(ALL_COLUMNS)
+	for i, record, columns in mismatched_rows(scanned, rows):
+		print('select error on row', i, ':', record, ', correct:', columns)
 	print("Select finished.")
 	
 	#input()
-	update_time_0 = perf_counter()
-	for key in records:
-		updated_columns = [None, None, None, None, None]
-		for i in range(2, grades_table.num_columns):
+	# queue one update per column from 2 on for every key, in the same order
+	# the per-key loop used, and apply them all in a single batch
+	update_keys = []
+	update_values = []
+	values = iter(choices(range(0, 21), k=len(keys) * (ncols - 2)))
+	for key, row in zip(keys, rows):
+		for i in range(2, ncols):
+			updated_columns = [None] * ncols
 			# updated value
-			value = randint(0, 20)
-			updated_columns[i] = value
-			# copy record to check
-			original = records[key].copy()
-			# update our test directory
-			records[key][i] = value
-			query.update(key, *updated_columns)
-			record = query.select(key, 0, [1, 1, 1, 1, 1])[0]
-			#print('Select for key: ', key, ' ', record)
-			error = False
-			for j, column in enumerate(record.columns):
-				if column != records[key][j]:
-					error = True
-			if error:
-				print('update error on', original, 'and', updated_columns, ':', record, ', correct:', records[key])
-
-			for update_column in range(1, grades_table.num_columns):
-				record = query.select(records[key][update_column], update_column, [1, 1, 1, 1, 1])
-				if(len(record) == 0):
-					error = True
-				else:
-					error = len([x for x in record if x.columns[0] == key]) == 0
-			if error:
-				print('select error on non-primary key', update_column, 'and', updated_columns, ':', [x.columns for x in record], ', correct:', records[key])
-			else:
-				pass
-			#	print('update on', original, 'and', updated_columns, ':', record)
-			updated_columns[i] = None
-	update_time_1 = perf_counter()
-	print("Updating 10k records took:  \t\t\t", update_time_1 - update_time_0)
+			updated_columns[i] = row[i] = next(values)
+			update_keys.append(key)
+			update_values.append(updated_columns)
+
+	update_time_0 = perf_counter_ns()
+	updated = query.update_many(update_keys, update_values)
+	update_time_1 = perf_counter_ns()
+	print("Updating", len(update_keys), "records took:  \t\t\t", (update_time_1 - update_time_0) / 1e9)
+
+	for key, columns, success in zip(update_keys, update_values, updated):
+		if not success:
+			print('update failed on', key, 'and', columns)
+
+	# one scan checks the final state of every row
+	scanned = query.scan_all(ALL_COLUMNS)
+	for i, record, columns in mismatched_rows(scanned, rows):
+		print('update error on row', i, ':', record, ', correct:', columns)
+
+	for update_column in range(1, ncols):
+		column_values = [row[update_column] for row in rows]
+		selected = query.select_many(column_values, update_column, ALL_COLUMNS)
+		for key, row, result in zip(keys, rows, selected):
+			if not any(x.columns[0] == key for x in result):
+				print('select error on non-primary key', update_column, ':', [x.columns for x in result], ', correct:', row)
 	print("Update finished.")
-	keys = sorted(list(records.keys()))
 	# aggregate on every column 
 
-	for c in range(0, grades_table.num_columns):
+	for c in range(0, ncols):
+		# prefix sums over the key-sorted column turn every range sum into one subtraction
+		prefix = [0, *accumulate(map(itemgetter(c), sorted_rows))]
 		for i in range(0, number_of_aggregates):
-			r = sorted(sample(range(0, len(keys)), 2))
+			r = sorted(sample(range(0, len(sorted_keys)), 2))
 			# calculate the sum form test directory
-			column_sum = sum(map(lambda key: records[key][c], keys[r[0]: r[1] + 1]))
+			column_sum = prefix[r[1] + 1] - prefix[r[0]]
 			
-			result = query.sum(keys[r[0]], keys[r[1]], c)
+			result = query.sum(sorted_keys[r[0]], sorted_keys[r[1]], c)
 			if column_sum != result:
-				print('sum error on [', keys[r[0]], ',', keys[r[1]], ']: ', result, ', correct: ', column_sum)
+				print('sum error on [', sorted_keys[r[0]], ',', sorted_keys[r[1]], ']: ', result, ', correct: ', column_sum)
 			else:
 				pass
-				# print('sum on [', keys[r[0]], ',', keys[r[1]], ']: ', column_sum)
+				# print('sum on [', sorted_keys[r[0]], ',', sorted_keys[r[1]], ']: ', column_sum)
 	print("Aggregate finished.")
 
-	for key in keys:
-		query.delete(key)
+	query.delete_many(sorted_keys)
 
-	for key in keys:
-		if len(query.select(key, 0, [1,1,1,1,1])) != 0:
+	for key, result in zip(sorted_keys, query.select_many(sorted_keys, 0, ALL_COLUMNS)):
+		if len(result) != 0:
 			print('delete error on ', key)
 	
 	print("Delete finished.")
@@ -135,61 +133,80 @@ def benchmark():
 	db.open('./meme')
 	grades_table = db.create_table('Grades', 5, 0)
 	query = Query(grades_table)
-	keys = []
-
 	num_its = 20000
 
-	insert_time_0 = perf_counter()
-	for i in range(0, num_its):
-		query.insert(906659671 + i, 93, 0, 0, 0)
-		keys.append(906659671 + i)
-	insert_time_1 = perf_counter()
+	keys = range(906659671, 906659671 + num_its)
+	inserted = [[key, 93, 0, 0, 0] for key in keys]
 
-	print("Inserting", num_its, "records took:  \t\t\t", insert_time_1 - insert_time_0)
+	insert_time_0 = perf_counter_ns()
+	query.insert_many(inserted)
+	insert_time_1 = perf_counter_ns()
+
+	print("Inserting", num_its, "records took:  \t\t\t", (insert_time_1 - insert_time_0) / 1e9)
 	
-	select_time_0 = perf_counter()
-	for i in range(0, num_its):
-		query.select(choice(keys), 0, [1, 1, 1, 1, 1])
-	select_time_1 = perf_counter()
-	print("Selecting", num_its, "records took:  \t\t\t", select_time_1 - select_time_0)
-
-	update_cols = [
-    [None, None, None, None, None],
-    [None, randrange(0, 100), None, None, None],
-    [None, None, randrange(0, 100), None, None],
-    [None, None, None, randrange(0, 100), None],
-    [None, None, None, None, randrange(0, 100)],
-]
-	update_time_0 = perf_counter()
-	for i in range(0, num_its):
-		query.update(choice(keys), *(choice(update_cols)))
-	update_time_1 = perf_counter()
-	print("Updating", num_its, "records took:  \t\t\t", update_time_1 - update_time_0)
+	select_keys = choices(keys, k=num_its)
+	select_time_0 = perf_counter_ns()
+	query.select_many(select_keys, 0, ALL_COLUMNS)
+	select_time_1 = perf_counter_ns()
+	print("Selecting", num_its, "records took:  \t\t\t", (select_time_1 - select_time_0) / 1e9)
+
+	update_cols = make_update_cols(5)
+	update_keys = choices(keys, k=num_its)
+	update_values = choices(update_cols, k=num_its)
+	update_time_0 = perf_counter_ns()
+	query.update_many(update_keys, update_values)
+	update_time_1 = perf_counter_ns()
+	print("Updating", num_its, "records took:  \t\t\t", (update_time_1 - update_time_0) / 1e9)
 
 	# Measuring Select Performance
-	select_time_0 = perf_counter()
-	for i in range(0, num_its):
-		query.select(choice(keys), 0, [1, 1, 1, 1, 1])
-	select_time_1 = perf_counter()
-	print("Selecting", num_its, "records took:  \t\t\t", select_time_1 - select_time_0)
+	select_keys = choices(keys, k=num_its)
+	select_time_0 = perf_counter_ns()
+	query.select_many(select_keys, 0, ALL_COLUMNS)
+	select_time_1 = perf_counter_ns()
+	print("Selecting", num_its, "records took:  \t\t\t", (select_time_1 - select_time_0) / 1e9)
 	
 	# Measuring Aggregate Performance
-	agg_time_0 = perf_counter()
+	agg_time_0 = perf_counter_ns()
 	for i in range(0, num_its, 100):
 		start_value = 906659671 + i
 		end_value = start_value + 100
 		result = query.sum(start_value, end_value - 1, randrange(0, 5))
-	agg_time_1 = perf_counter()
-	print("Aggregate", num_its, "of 100 record batch took:\t\t", agg_time_1 - agg_time_0)
+	agg_time_1 = perf_counter_ns()
+	print("Aggregate", num_its, "of 100 record batch took:\t\t", (agg_time_1 - agg_time_0) / 1e9)
 
 	# Measuring Delete Performance
-	delete_time_0 = perf_counter()
-	for i in range(0, num_its):
-		query.delete(906659671 + i)
-	delete_time_1 = perf_counter()
-	print("Deleting", num_its, "records took:  \t\t\t", delete_time_1 - delete_time_0)
-
-print("Validate: ")
-validate()
-print("Benchmark: ")
-benchmark()
+	delete_time_0 = perf_counter_ns()
+	query.delete_many(keys)
+	delete_time_1 = perf_counter_ns()
+	print("Deleting", num_its, "records took:  \t\t\t", (delete_time_1 - delete_time_0) / 1e9)
+
+def bench():
+	import bench
+	bench.main()
+
+def run_script(name):
+	# these scripts do their work at the top level, so run them as a whole
+	run_path(path.join(path.dirname(path.abspath(__file__)), name + '.py'), run_name='__main__')
+
+COMMANDS = {
+	'validate': validate,
+	'benchmark': benchmark,
+	'bench': bench,
+	'merge': lambda: run_script('merge'),
+	'small_merge_test': lambda: run_script('small_merge_test'),
+	'special_cases': lambda: run_script('special_cases'),
+}
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Run the crabstore validation and benchmark scripts.')
+	parser.add_argument('command', nargs='?', choices=COMMANDS, help='script to run (default: validate, then benchmark)')
+	command = parser.parse_args().command
+
+	if command is None:
+		print("Validate: ")
+		validate()
+		print("Benchmark: ")
+		benchmark()
+	else:
+		COMMANDS[command]()
+
@@ -1,86 +1,104 @@
 from lstore.db import Database
 from lstore.query import Query
-from time import perf_counter
-from random import choice, randrange
-from time import perf_counter
+from bench_utils import ALL_COLUMNS, make_update_cols
+from time import perf_counter_ns
+from random import choices, randrange
 from statistics import mean
+from multiprocessing import Pool
+from os import environ
+from shutil import rmtree
+from tempfile import mkdtemp
+import argparse
 
-def bench():
-    # Student Id and 4 grades
-    db = Database()
-    grades_table = db.create_table('Grades', 5, 0)
-    query = Query(grades_table)
-    keys = []
+def bench(query):
+    keys = range(906659671, 906659671 + 10000)
+    records = [[key, 93, 0, 0, 0] for key in keys]
 
-    insert_time_0 = perf_counter()
-    for i in range(0, 10000):
-        query.insert(906659671 + i, 93, 0, 0, 0)
-        keys.append(906659671 + i)
-    insert_time_1 = perf_counter()
+    insert_time_0 = perf_counter_ns()
+    query.insert_many(records)
+    insert_time_1 = perf_counter_ns()
 
     insert_time = insert_time_1 - insert_time_0
 
     # Measuring update Performance
-    update_cols = [
-        [None, None, None, None, None],
-        [None, randrange(0, 100), None, None, None],
-        [None, None, randrange(0, 100), None, None],
-        [None, None, None, randrange(0, 100), None],
-        [None, None, None, None, randrange(0, 100)],
-    ]
+    update_cols = make_update_cols(5)
 
+    update_keys = choices(keys, k=10000)
+    update_values = choices(update_cols, k=10000)
 
-    update_time_0 = perf_counter()
-    for i in range(0, 10000):
-        query.update(choice(keys), *(choice(update_cols)))
-    update_time_1 = perf_counter()
+    update_time_0 = perf_counter_ns()
+    query.update_many(update_keys, update_values)
+    update_time_1 = perf_counter_ns()
 
     update_time = update_time_1 - update_time_0
 
     # Measuring Select Performance
-    select_time_0 = perf_counter()
-    for i in range(0, 10000):
-        query.select(choice(keys),0 , [1, 1, 1, 1, 1])
-    select_time_1 = perf_counter()
+    select_keys = choices(keys, k=10000)
+
+    select_time_0 = perf_counter_ns()
+    query.select_many(select_keys, 0, ALL_COLUMNS)
+    select_time_1 = perf_counter_ns()
 
     select_time = select_time_1 - select_time_0
 
     # Measuring Aggregate Performance
-    agg_time_0 = perf_counter()
+    agg_time_0 = perf_counter_ns()
     for i in range(0, 10000, 100):
         start_value = 906659671 + i
         end_value = start_value + 100
         result = query.sum(start_value, end_value - 1, randrange(0, 5))
-    agg_time_1 = perf_counter()
+    agg_time_1 = perf_counter_ns()
 
     agg_time = agg_time_1 - agg_time_0
 
     # Measuring Delete Performance
-    delete_time_0 = perf_counter()
-    for i in range(0, 10000):
-        query.delete(906659671 + i)
-    delete_time_1 = perf_counter()
+    delete_time_0 = perf_counter_ns()
+    query.delete_many(keys)
+    delete_time_1 = perf_counter_ns()
 
     delete_time = delete_time_1 - delete_time_0
 
     return (insert_time, update_time, select_time, agg_time, delete_time)
 
-insert = []
-update = []
-select = []
-agg = []
-delete = []
-
-for i in range(0, 10):
-    (i, u, s, a, d) = bench()
-    insert.append(i)
-    update.append(u)
-    select.append(s)
-    agg.append(a)
-    delete.append(d)
-
-print(f"Mean insert time for 10k records over 10 runs: {mean(insert)}")
-print(f"Mean update time for 10k records over 10 runs: {mean(update)}")
-print(f"Mean select time for 10k records over 10 runs: {mean(select)}")
-print(f"Mean agg time for 10k records over 10 runs: {mean(agg)}")
-print(f"Mean delete time for 10k records over 10 runs: {mean(delete)}")
\ No newline at end of file
+def bench_worker(runs):
+    results = []
+    for _ in range(0, runs):
+        # Student Id and 4 grades
+        # every run gets a fresh table in its own directory, so runs start from
+        # the same cold state and parallel workers don't share files
+        directory = mkdtemp(prefix='crab_bench_')
+        db = Database()
+        db.open(directory)
+        grades_table = db.create_table('Grades', 5, 0)
+        results.append(bench(Query(grades_table)))
+        db.close()
+        rmtree(directory, ignore_errors=True)
+
+    return results
+
+def main(jobs=None):
+    # one worker by default so the timings aren't skewed by the other workers
+    # competing for CPU, memory bandwidth and disk; BENCH_JOBS or --jobs opts in
+    if jobs is None:
+        jobs = int(environ.get('BENCH_JOBS', 1))
+    workers = max(1, min(10, jobs))
+    # split the 10 runs as evenly as possible across the workers
+    runs = [10 // workers + (i < 10 % workers) for i in range(0, workers)]
+
+    with Pool(workers) as pool:
+        results = [result for worker in pool.map(bench_worker, runs) for result in worker]
+
+    (insert, update, select, agg, delete) = zip(*results)
+
+    if workers > 1:
+        print(f"Runs were split across {workers} parallel workers; the means include contention between them")
+    print(f"Mean insert time for 10k records over 10 runs: {mean(insert) / 1e9}")
+    print(f"Mean update time for 10k records over 10 runs: {mean(update) / 1e9}")
+    print(f"Mean select time for 10k records over 10 runs: {mean(select) / 1e9}")
+    print(f"Mean agg time for 10k records over 10 runs: {mean(agg) / 1e9}")
+    print(f"Mean delete time for 10k records over 10 runs: {mean(delete) / 1e9}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time the grades table operations over 10 runs.')
+    parser.add_argument('--jobs', type=int, help='worker processes to split the runs across (default: BENCH_JOBS or 1)')
+    main(parser.parse_args().jobs)
@@ -0,0 +1,25 @@
+from random import randrange
+from itertools import zip_longest
+
+# projections shared by the scripts; the second is an int bitmask with bit i
+# selecting column i, so it picks the first four columns of any table
+ALL_COLUMNS = (1, 1, 1, 1, 1)
+FIRST_FOUR_COLUMNS = 0b1111
+
+def make_update_cols(num_columns):
+	# one template that changes nothing, then one per non-key column
+	update_cols = [[None] * num_columns]
+	for i in range(1, num_columns):
+		columns = [None] * num_columns
+		columns[i] = randrange(0, 100)
+		update_cols.append(columns)
+	return update_cols
+
+def mismatched_rows(records, expected):
+	# comparing whole column lists keeps the per-column loop out of Python; the
+	# shorter list is padded with None so missing and extra records show up too
+	return [
+		(i, record, columns)
+		for i, (record, columns) in enumerate(zip_longest(records, expected))
+		if record is None or columns is None or record.columns != columns
+	]
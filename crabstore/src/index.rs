@@ -149,4 +149,10 @@ impl Index {
     pub fn drop_index(&mut self, column_number: usize) {
         self.indices[column_number] = None;
     }
+
+    pub fn clear(&mut self) {
+        for index in self.indices.iter_mut().flatten() {
+            index.clear();
+        }
+    }
 }
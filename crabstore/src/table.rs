@@ -503,34 +503,69 @@ impl Table {
         }
 
         vals.into_iter()
-            .map(|rid| {
-                let rid = self.get_latest(rid);
-                let page = self.get_page(rid);
-
-                let result_cols = included_columns
-                    .iter()
-                    .enumerate()
-                    .filter_map(|(i, x)| {
-                        if *x != 0 {
-                            Some(
-                                page.get_column(
-                                    self.bufferpool.lock().borrow_mut(),
-                                    NUM_METADATA_COLUMNS + i,
-                                )
-                                .slot(rid.slot()),
-                            )
-                        } else {
-                            None
-                        }
-                    })
-                    .collect::<Vec<u64>>();
-
-                Record {
-                    rid: rid.raw(),
-                    columns: result_cols,
+            .map(|rid| self.read_record(self.get_latest(rid), included_columns))
+            .collect()
+    }
+
+    pub fn scan_query(
+        &self,
+        included_columns: &[usize],
+        mut transaction: Option<&mut Transaction>,
+    ) -> Vec<Record> {
+        let mut records = Vec::new();
+        let mut rid: RID = 0.into();
+        let next_rid = self.next_rid.load(Ordering::Relaxed);
+
+        while rid.raw() < next_rid {
+            if self
+                .get_page(rid)
+                .get_column(self.bufferpool.lock().borrow_mut(), METADATA_RID)
+                .slot(rid.slot())
+                == RID_INVALID
+            {
+                rid = rid.next();
+                continue;
+            }
+
+            if let Some(t) = transaction.borrow_mut() {
+                if !t.try_lock_with_abort(&self.lock_manager, rid, LockType::Shared) {
+                    return Vec::new();
+                }
+            }
+
+            records.push(self.read_record(self.get_latest(rid), included_columns));
+
+            rid = rid.next();
+        }
+
+        records
+    }
+
+    fn read_record(&self, rid: RID, included_columns: &[usize]) -> Record {
+        let page = self.get_page(rid);
+
+        let result_cols = included_columns
+            .iter()
+            .enumerate()
+            .filter_map(|(i, x)| {
+                if *x != 0 {
+                    Some(
+                        page.get_column(
+                            self.bufferpool.lock().borrow_mut(),
+                            NUM_METADATA_COLUMNS + i,
+                        )
+                        .slot(rid.slot()),
+                    )
+                } else {
+                    None
                 }
             })
-            .collect()
+            .collect::<Vec<u64>>();
+
+        Record {
+            rid: rid.raw(),
+            columns: result_cols,
+        }
     }
 
     pub fn insert_query(&self, values: &[u64], mut transaction: Option<&mut Transaction>) {
@@ -557,39 +592,7 @@ impl Table {
         let page: Arc<[usize]> = match page_dir.get(rid) {
             None => {
                 drop(page_dir);
-                let mut page_dir = self.page_dir.write();
-                // Check again since unlocking read and acquiring write are not atomic
-                if page_dir.get(rid).is_none() {
-                    let reserve_count = self.total_columns() * PAGE_RANGE_COUNT;
-                    let reserved = self.disk.reserve_range(reserve_count);
-
-                    for i in 0..PAGE_RANGE_COUNT {
-                        let page_id = (rid.page_range() * PAGE_RANGE_COUNT) + i;
-                        let mut column_pages =
-                            Arc::<[usize]>::new_uninit_slice(self.total_columns());
-
-                        let start_offset = reserved + (i * self.total_columns());
-
-                        for (i, x) in
-                            (start_offset..(start_offset + self.total_columns())).enumerate()
-                        {
-                            Arc::get_mut(&mut column_pages).unwrap()[i].write(x);
-                        }
-
-                        let column_pages = unsafe { column_pages.assume_init() };
-
-                        self.bufferpool
-                            .lock()
-                            .get_page(column_pages[METADATA_PAGE_HEADER])
-                            .write_slot(0, RID_INVALID);
-
-                        page_dir.new_page(page_id, column_pages);
-                    }
-                }
-
-                page_dir
-                    .get(rid)
-                    .expect("Allocated new pages but no mapping in directory")
+                self.allocate_base_range(rid)
             }
             Some(cols) => cols,
         };
@@ -633,6 +636,146 @@ impl Table {
         }
     }
 
+    fn allocate_base_range(&self, rid: RID) -> Arc<[usize]> {
+        let mut page_dir = self.page_dir.write();
+        // Check again since unlocking read and acquiring write are not atomic
+        if page_dir.get(rid).is_none() {
+            let reserve_count = self.total_columns() * PAGE_RANGE_COUNT;
+            let reserved = self.disk.reserve_range(reserve_count);
+
+            for i in 0..PAGE_RANGE_COUNT {
+                let page_id = (rid.page_range() * PAGE_RANGE_COUNT) + i;
+                let mut column_pages = Arc::<[usize]>::new_uninit_slice(self.total_columns());
+
+                let start_offset = reserved + (i * self.total_columns());
+
+                for (i, x) in (start_offset..(start_offset + self.total_columns())).enumerate() {
+                    Arc::get_mut(&mut column_pages).unwrap()[i].write(x);
+                }
+
+                let column_pages = unsafe { column_pages.assume_init() };
+
+                self.bufferpool
+                    .lock()
+                    .get_page(column_pages[METADATA_PAGE_HEADER])
+                    .write_slot(0, RID_INVALID);
+
+                page_dir.new_page(page_id, column_pages);
+            }
+        }
+
+        page_dir
+            .get(rid)
+            .expect("Allocated new pages but no mapping in directory")
+    }
+
+    /*
+        Bulk insert without transaction support. Rows are given consecutive RIDs
+        and written one column page at a time, so each page frame is locked once
+        per block instead of once per slot. Returns false without writing
+        anything if any row does not have exactly one value per column.
+    */
+    pub fn insert_block_query(&self, rows: &[Vec<u64>]) -> bool {
+        if rows.iter().any(|row| row.len() != self.num_columns) {
+            return false;
+        }
+
+        let mut seen: FxHashSet<u64> = FxHashSet::default();
+        let rows = rows
+            .iter()
+            .filter(|row| {
+                let key = row[self.primary_key_index];
+                seen.insert(key) && self.find_row(self.primary_key_index, key).is_none()
+            })
+            .collect::<Vec<&Vec<u64>>>();
+
+        if rows.is_empty() {
+            return true;
+        }
+
+        let start = self
+            .next_rid
+            .fetch_add(rows.len() as u64, Ordering::Relaxed);
+
+        let mut offset = 0;
+        while offset < rows.len() {
+            let rid: RID = (start + offset as u64).into();
+            let count = (PAGE_SLOTS - rid.slot()).min(rows.len() - offset);
+            let block = &rows[offset..offset + count];
+
+            let page_dir = self.page_dir.read();
+
+            let page = Page::new(match page_dir.get(rid) {
+                None => {
+                    drop(page_dir);
+                    self.allocate_base_range(rid)
+                }
+                Some(cols) => cols,
+            });
+
+            self.write_block(
+                &page,
+                METADATA_INDIRECTION,
+                rid,
+                block.iter().map(|_| RID_INVALID),
+            );
+            self.write_block(
+                &page,
+                METADATA_SCHEMA_ENCODING,
+                rid,
+                block.iter().map(|_| 0),
+            );
+
+            for i in 0..self.num_columns {
+                self.write_block(
+                    &page,
+                    NUM_METADATA_COLUMNS + i,
+                    rid,
+                    block.iter().map(|row| row[i]),
+                );
+            }
+
+            self.write_block(
+                &page,
+                METADATA_RID,
+                rid,
+                (0..count).map(|i| rid.raw() + i as u64),
+            );
+
+            offset += count;
+        }
+
+        let mut index = self.index.write();
+        for (i, row) in rows.iter().enumerate() {
+            let rid: RID = (start + i as u64).into();
+            for column in 0..self.num_columns {
+                index.update_index(column, row[column], rid);
+            }
+        }
+
+        true
+    }
+
+    fn write_block(
+        &self,
+        page: &Page,
+        column: usize,
+        start: RID,
+        values: impl Iterator<Item = u64>,
+    ) {
+        let frame = page.get_column(self.bufferpool.lock().borrow_mut(), column);
+        frame.mark_dirty();
+
+        let mut physical = frame
+            .raw()
+            .write()
+            .expect("Couldn't lock physical page, poisoned?");
+
+        for (i, value) in values.enumerate() {
+            physical.write_slot(start.slot() + i, value);
+        }
+    }
+
     pub fn sum_query(
         &self,
         start_range: u64,
@@ -840,6 +983,13 @@ impl Table {
             }
         }
 
+        self.invalidate_row(row, transaction);
+
+        true
+    }
+
+    // Marks a base row and every version on its tail chain as deleted.
+    fn invalidate_row(&self, row: RID, mut transaction: Option<&mut Transaction>) {
         let mut next_tail: RID = self
             .get_page(row)
             .get_column(self.bufferpool.lock().borrow_mut(), METADATA_INDIRECTION)
@@ -870,8 +1020,33 @@ impl Table {
         self.get_page(row)
             .get_column(self.bufferpool.lock().borrow_mut(), METADATA_RID)
             .write_slot(row.slot(), RID_INVALID);
+    }
 
-        true
+    /*
+        Deletes every record and empties the indexes. Rows are invalidated by RID
+        rather than looked up by key, so rows whose primary key was updated are
+        removed too. RIDs are never reused, so the pages stay allocated and later
+        inserts go to new pages rather than the ones the deleted rows occupied.
+    */
+    pub fn truncate(&self) {
+        let mut rid: RID = 0.into();
+        let next_rid = self.next_rid.load(Ordering::Relaxed);
+
+        while rid.raw() < next_rid {
+            let page = self.get_page(rid);
+
+            if page
+                .get_column(self.bufferpool.lock().borrow_mut(), METADATA_RID)
+                .slot(rid.slot())
+                != RID_INVALID
+            {
+                self.invalidate_row(rid, None);
+            }
+
+            rid = rid.next();
+        }
+
+        self.index.write().clear();
     }
 
     pub fn build_index(&self, column_num: usize) {
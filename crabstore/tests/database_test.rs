@@ -164,6 +164,135 @@ fn correctness_tester2() {
     assert_eq!(result, 5);
 }
 
+#[test]
+fn scan_tester() {
+    let records = [
+        [3, 1, 1, 2, 1],
+        [1, 1, 1, 1, 2],
+        [2, 0, 3, 5, 1],
+        [0, 1, 5, 1, 3],
+    ];
+
+    let dir = tempdir().unwrap();
+
+    let mut crabstore = CrabStore::new(dir.path().into());
+    crabstore.open();
+
+    let table = crabstore.create_table("scan", 5, 0);
+
+    for record in records.iter() {
+        table.insert_query(record, None);
+    }
+
+    table.update_query(1, &[None, Some(9), None, None, None], None);
+    table.delete_query(2, None);
+
+    let result = table
+        .scan_query(&[1, 1, 1, 1, 1], None)
+        .into_iter()
+        .map(|x| x.columns)
+        .collect::<Vec<Vec<u64>>>();
+
+    assert_eq!(
+        result,
+        vec![
+            vec![3, 1, 1, 2, 1],
+            vec![1, 9, 1, 1, 2],
+            vec![0, 1, 5, 1, 3]
+        ]
+    );
+}
+
+#[test]
+fn insert_block_tester() {
+    let num_records = 2000;
+
+    let dir = tempdir().unwrap();
+
+    let mut crabstore = CrabStore::new(dir.path().into());
+    crabstore.open();
+
+    let table = crabstore.create_table("block", 4, 0);
+
+    table.insert_query(&[5, 0, 0, 0], None);
+
+    let mut rows = (0..num_records)
+        .map(|i| vec![i, i + 1, i + 2, i + 3])
+        .collect::<Vec<Vec<u64>>>();
+    rows.push(vec![7, 9, 9, 9]);
+
+    assert!(table.insert_block_query(&rows));
+
+    let selected = table.select_query(5, 0, &[1, 1, 1, 1], None);
+    assert_eq!(selected.len(), 1);
+    assert_eq!(selected[0].columns, [5, 0, 0, 0]);
+
+    for i in 0..num_records {
+        if i == 5 {
+            continue;
+        }
+        let selected = table.select_query(i, 0, &[1, 1, 1, 1], None);
+        assert_eq!(selected[0].columns, [i, i + 1, i + 2, i + 3]);
+    }
+
+    assert_eq!(
+        table.scan_query(&[1, 1, 1, 1], None).len(),
+        num_records as usize
+    );
+
+    let sum = table.sum_query(0, num_records, 1, None);
+    assert_eq!(sum, (1..=num_records).sum::<u64>() - 6);
+
+    let bad_rows = vec![
+        vec![num_records, 1, 1, 1],
+        vec![num_records + 1, 1, 1],
+        vec![num_records + 2, 1, 1, 1, 1],
+    ];
+    assert!(!table.insert_block_query(&bad_rows));
+    assert_eq!(
+        table.scan_query(&[1, 1, 1, 1], None).len(),
+        num_records as usize
+    );
+    assert_eq!(
+        table
+            .select_query(num_records, 0, &[1, 1, 1, 1], None)
+            .len(),
+        0
+    );
+}
+
+#[test]
+fn truncate_tester() {
+    let dir = tempdir().unwrap();
+
+    let mut crabstore = CrabStore::new(dir.path().into());
+    crabstore.open();
+
+    let table = crabstore.create_table("truncate", 4, 0);
+
+    for i in 0..1000 {
+        table.insert_query(&[i, 1, 2, 3], None);
+    }
+    table.update_query(10, &[None, Some(5), None, None], None);
+    table.update_query(20, &[Some(5000), None, None, None], None);
+
+    table.truncate();
+
+    assert_eq!(table.scan_query(&[1, 1, 1, 1], None).len(), 0);
+    assert_eq!(table.select_query(10, 0, &[1, 1, 1, 1], None).len(), 0);
+    assert_eq!(table.select_query(5000, 0, &[1, 1, 1, 1], None).len(), 0);
+    assert_eq!(table.sum_query(0, 1000, 1, None), 0);
+
+    table.insert_query(&[10, 4, 4, 4], None);
+
+    table.insert_query(&[5000, 4, 4, 4], None);
+
+    let selected = table.select_query(10, 0, &[1, 1, 1, 1], None);
+    assert_eq!(selected.len(), 1);
+    assert_eq!(selected[0].columns, [10, 4, 4, 4]);
+    assert_eq!(table.scan_query(&[1, 1, 1, 1], None).len(), 2);
+}
+
 const NUMBER_OF_RECORDS: u64 = 1000;
 const NUMBER_OF_AGGREGATES: u64 = 100;
 const NUMBER_OF_UPDATES: u64 = 1;
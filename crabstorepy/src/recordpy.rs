@@ -10,10 +10,7 @@ pub struct RecordPy {
 
 impl RecordPy {
     pub fn from(record: &Record, py: Python) -> Py<Self> {
-        let result_cols = PyList::empty(py);
-        for c in record.columns.iter() {
-            result_cols.append(c).unwrap();
-        }
+        let result_cols = PyList::new(py, &record.columns);
         Py::new(py, RecordPy::new(record.rid, result_cols.into())).unwrap()
     }
 }
@@ -1,7 +1,8 @@
 use std::{path::Path, sync::Arc};
 
-use crabcore::table::Table;
+use crabcore::{record::Record, table::Table};
 use pyo3::{
+    exceptions::{PyTypeError, PyValueError},
     prelude::*,
     types::{PyList, PyTuple},
 };
@@ -45,6 +46,47 @@ impl TablePy {
     }
 }
 
+impl TablePy {
+    fn records_to_list(py: Python<'_>, records: &[Record]) -> Py<PyList> {
+        let selected_records: Py<PyList> = PyList::empty(py).into();
+        for record in records {
+            selected_records
+                .as_ref(py)
+                .append(RecordPy::from(record, py))
+                .expect("Failed to append to python list");
+        }
+        selected_records
+    }
+
+    // Projections arrive either as a list of 1/0 flags or as an int bitmask
+    // with bit i selecting column i; both become the flag slice the table reads.
+    fn projection(&self, columns: &PyAny) -> PyResult<Vec<usize>> {
+        if let Ok(mask) = columns.extract::<u64>() {
+            return Ok((0..self.0.columns())
+                .map(|i| ((mask >> i) & 1) as usize)
+                .collect());
+        }
+
+        let flags = columns
+            .iter()
+            .map_err(|_| {
+                PyTypeError::new_err("Projection must be a bitmask or a sequence of 1/0 flags")
+            })?
+            .map(|flag| flag?.extract::<usize>())
+            .collect::<PyResult<Vec<usize>>>()?;
+
+        if flags.len() > self.0.columns() {
+            return Err(PyValueError::new_err(format!(
+                "Projection has {} flags but the table has {} columns",
+                flags.len(),
+                self.0.columns()
+            )));
+        }
+
+        Ok(flags)
+    }
+}
+
 #[pymethods]
 impl TablePy {
     #[getter]
@@ -67,18 +109,15 @@ impl TablePy {
         py: Python<'_>,
         search_value: u64,
         column_index: usize,
-        columns: &PyList,
-    ) -> Py<PyList> {
+        columns: &PyAny,
+    ) -> PyResult<Py<PyList>> {
         if column_index >= self.0.columns() {
-            return Python::with_gil(|py| -> Py<PyList> { PyList::empty(py).into() });
+            return Ok(Python::with_gil(|py| -> Py<PyList> {
+                PyList::empty(py).into()
+            }));
         }
 
-        let included_columns: Vec<usize> = columns
-            .iter()
-            .enumerate()
-            .filter(|(_i, x)| x.extract::<u64>().unwrap() != 0)
-            .map(|(i, _x)| i)
-            .collect();
+        let included_columns = self.projection(columns)?;
 
         let mut results = vec![];
         py.allow_threads(|| {
@@ -87,18 +126,52 @@ impl TablePy {
                 .select_query(search_value, column_index, &included_columns, None);
         });
 
-        Python::with_gil(|py| -> Py<PyList> {
-            let selected_records: Py<PyList> = PyList::empty(py).into();
-            for result in results {
-                selected_records
-                    .as_ref(py)
-                    .append(RecordPy::from(&result, py))
-                    .expect("Failed to append to python list");
-            }
-            selected_records
-        })
+        Ok(Python::with_gil(|py| -> Py<PyList> {
+            TablePy::records_to_list(py, &results)
+        }))
     }
 
+    pub fn select_many(
+        &self,
+        py: Python<'_>,
+        search_values: Vec<u64>,
+        column_index: usize,
+        columns: &PyAny,
+    ) -> PyResult<Py<PyList>> {
+        if column_index >= self.0.columns() {
+            return Ok(PyList::empty(py).into());
+        }
+
+        let included_columns = self.projection(columns)?;
+
+        let results = py.allow_threads(|| {
+            search_values
+                .iter()
+                .map(|value| {
+                    self.0
+                        .select_query(*value, column_index, &included_columns, None)
+                })
+                .collect::<Vec<Vec<Record>>>()
+        });
+
+        let selected: Py<PyList> = PyList::empty(py).into();
+        for result in results.iter() {
+            selected
+                .as_ref(py)
+                .append(TablePy::records_to_list(py, result))?;
+        }
+        Ok(selected)
+    }
+
+    pub fn scan_all(&self, py: Python<'_>, columns: &PyAny) -> PyResult<Py<PyList>> {
+        let included_columns = self.projection(columns)?;
+
+        let results = py.allow_threads(|| self.0.scan_query(&included_columns, None));
+
+        Ok(TablePy::records_to_list(py, &results))
+    }
+
+    #[pyo3(signature = (key, *values))]
     pub fn update(&self, py: Python<'_>, key: u64, values: &PyTuple) -> bool {
         let vals: Vec<Option<u64>> = values
             .iter()
@@ -108,10 +181,53 @@ impl TablePy {
         py.allow_threads(move || self.0.update_query(key, &vals, None))
     }
 
+    pub fn update_many(
+        &self,
+        py: Python<'_>,
+        keys: Vec<u64>,
+        values: Vec<Vec<Option<u64>>>,
+    ) -> PyResult<Vec<bool>> {
+        if keys.len() != values.len() {
+            return Err(PyValueError::new_err(format!(
+                "Got {} keys but {} rows of values",
+                keys.len(),
+                values.len()
+            )));
+        }
+
+        if let Some((i, row)) = values
+            .iter()
+            .enumerate()
+            .find(|(_, row)| row.len() != self.0.columns())
+        {
+            return Err(PyValueError::new_err(format!(
+                "Row {} has {} values but the table has {} columns",
+                i,
+                row.len(),
+                self.0.columns()
+            )));
+        }
+
+        Ok(py.allow_threads(move || {
+            keys.iter()
+                .zip(values.iter())
+                .map(|(key, vals)| self.0.update_query(*key, vals, None))
+                .collect()
+        }))
+    }
+
     pub fn delete(&self, py: Python<'_>, key: u64) -> bool {
         py.allow_threads(move || self.0.delete_query(key, None))
     }
 
+    pub fn delete_many(&self, py: Python<'_>, keys: Vec<u64>) -> Vec<bool> {
+        py.allow_threads(move || {
+            keys.iter()
+                .map(|key| self.0.delete_query(*key, None))
+                .collect()
+        })
+    }
+
     #[pyo3(signature = (*values))]
     pub fn insert(&self, py: Python<'_>, values: &PyTuple) {
         let vals = values
@@ -122,6 +238,28 @@ impl TablePy {
         py.allow_threads(move || self.0.insert_query(&vals, None));
     }
 
+    pub fn insert_many(&self, py: Python<'_>, rows: Vec<Vec<u64>>) -> PyResult<()> {
+        if let Some((i, row)) = rows
+            .iter()
+            .enumerate()
+            .find(|(_, row)| row.len() != self.0.columns())
+        {
+            return Err(PyValueError::new_err(format!(
+                "Row {} has {} values but the table has {} columns",
+                i,
+                row.len(),
+                self.0.columns()
+            )));
+        }
+
+        py.allow_threads(move || self.0.insert_block_query(&rows));
+        Ok(())
+    }
+
+    pub fn truncate(&self, py: Python<'_>) {
+        py.allow_threads(|| self.0.truncate());
+    }
+
     pub fn build_index(&self, column_num: usize) {
         self.0.build_index(column_num);
     }
@@ -7,13 +7,21 @@ use crabstorewrap::{crabstorepy::CrabStorePy, recordpy::RecordPy, tablepy::Table
 use std::{
     path::{Path, PathBuf},
     str::FromStr,
+    sync::Once,
 };
 
 use pyo3::prelude::*;
+
+static ENVIRONMENT: Once = Once::new();
+
+// The tests share one interpreter, so the module is registered only once
 fn build_environment() {
+    ENVIRONMENT.call_once(|| {
+        pyo3::append_to_inittab!(crabstore);
+        pyo3::prepare_freethreaded_python();
+    });
+
     let module_base = "lstore.";
-    pyo3::append_to_inittab!(crabstore);
-    pyo3::prepare_freethreaded_python();
     Python::with_gil(|py| {
         let modules = [
             ("lstore/db.py", include_str!("../../lstore/db.py")),
@@ -44,3 +52,82 @@ fn database_test_py() {
         PyModule::from_code(py, include_str!("../../m2_1.py"), "", "").unwrap();
     });
 }
+
+#[test]
+fn update_many_test_py() {
+    build_environment();
+    Python::with_gil(|py| {
+        PyModule::from_code(
+            py,
+            r#"
+from lstore.db import Database
+from lstore.query import Query
+from tempfile import mkdtemp
+
+db = Database()
+db.open(mkdtemp())
+query = Query(db.create_table('Grades', 5, 0))
+query.insert_many([[1, 1, 1, 1, 1], [2, 2, 2, 2, 2]])
+
+for keys, values in (
+    ([1, 2], [[None, 5, None, None, None]]),
+    ([1, 2], [[None, 5, None, None, None], [None, 5, None]]),
+    ([1], [[None, 5, None, None, None, None]]),
+    ([1], [[]]),
+):
+    try:
+        query.update_many(keys, values)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('update_many accepted ' + repr(values))
+
+assert [r.columns for r in query.scan_all([1, 1, 1, 1, 1])] == [[1, 1, 1, 1, 1], [2, 2, 2, 2, 2]]
+assert query.update_many([1, 2], [[None, 5, None, None, None], [None, None, 6, None, None]]) == [True, True]
+assert [r.columns for r in query.scan_all([1, 1, 1, 1, 1])] == [[1, 5, 1, 1, 1], [2, 2, 6, 2, 2]]
+db.close()
+"#,
+            "",
+            "",
+        )
+        .unwrap();
+    });
+}
+
+#[test]
+fn projection_test_py() {
+    build_environment();
+    Python::with_gil(|py| {
+        PyModule::from_code(
+            py,
+            r#"
+from lstore.db import Database
+from lstore.query import Query
+from tempfile import mkdtemp
+
+db = Database()
+db.open(mkdtemp())
+query = Query(db.create_table('Grades', 5, 0))
+query.insert(7, 1, 2, 3, 4)
+
+assert query.select(7, 0, [1, 1, 1, 1, 1])[0].columns == [7, 1, 2, 3, 4]
+assert query.select(7, 0, 0b1111)[0].columns == [7, 1, 2, 3]
+assert query.select(7, 0, 0b10101)[0].columns == [7, 2, 4]
+assert query.select_many([7], 0, 0b1111)[0][0].columns == [7, 1, 2, 3]
+assert query.scan_all(0b1111)[0].columns == [7, 1, 2, 3]
+
+for projection, error in (([1, 1, 1, 1, 1, 1], ValueError), ('abc', TypeError), (None, TypeError)):
+    try:
+        query.select(7, 0, projection)
+    except error:
+        pass
+    else:
+        raise AssertionError('select accepted projection ' + repr(projection))
+db.close()
+"#,
+            "",
+            "",
+        )
+        .unwrap();
+    });
+}
@@ -3,6 +3,9 @@ from crabstore import CrabStorePy as CrabStore
 class Database:
     def __init__(self):
         self.crab_store = CrabStore()
-        
-    def __getattr__(self, name):
-        return getattr(self.crab_store, name)
+        # Bound directly on the instance so calls don't go through __getattr__
+        self.create_table = self.crab_store.create_table
+        self.drop_table = self.crab_store.drop_table
+        self.get_table = self.crab_store.get_table
+        self.open = self.crab_store.open
+        self.close = self.crab_store.close
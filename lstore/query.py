@@ -6,42 +6,67 @@ class Query:
     Queries that fail must return False
     Queries that succeed should return the result or True
     Any query that crashes (due to exceptions) should return False
+    Bad arguments raise instead: select, select_many and scan_all raise TypeError or
+    ValueError on a malformed projection, and insert_many and update_many raise
+    ValueError on rows of the wrong width
     """
     def __init__(self, table):
         self.table = table
-        pass
 
-    
-    """
-    # internal Method
-    # Read a record with specified RID
-    # Returns True upon succesful deletion
-    # Return False if record doesn't exist or is locked due to 2PL
-    """
-    def delete(self, primary_key):
-        return self.table.delete(primary_key)
-    
-    
-    """
-    # Insert a record with specified columns
-    # Return True upon succesful insertion
-    # Returns False if insert fails for whatever reason
-    """
-    def insert(self, *columns):
-        self.table.insert(*columns)
+        # The table's native methods take the arguments below directly, so
+        # they are bound onto the instance rather than wrapped in Python
 
-    
-    """
-    # Read matching record with specified search key
-    # :param search_key: the value you want to search based on
-    # :param search_key_index: the column index you want to search based on
-    # :param projected_columns_index: what columns to return. array of 1 or 0 values.
-    # Returns a list of Record objects upon success
-    # Returns False if record locked by TPL
-    # Assume that select will never be called on a key that doesn't exist
-    """
-    def select(self, search_key, search_key_index, projected_columns_index):
-        return self.table.select(search_key, search_key_index, projected_columns_index)
+        # Delete the record with the specified primary key
+        # Returns True upon succesful deletion
+        # Return False if record doesn't exist or is locked due to 2PL
+        self.delete = table.delete
+
+        # Deletes every record in the given list of primary keys in one call
+        # Returns a list with the delete result for each key
+        self.delete_many = table.delete_many
+
+        # Insert a record with specified columns: insert(*columns)
+        self.insert = table.insert
+
+        # Insert a batch of records, each given as a list of columns
+        # Raises ValueError, inserting nothing, if a record does not have one value per column
+        self.insert_many = table.insert_many
+
+        # Read matching record with specified search key:
+        # select(search_key, search_key_index, projected_columns_index)
+        # :param search_key: the value you want to search based on
+        # :param search_key_index: the column index you want to search based on
+        # :param projected_columns_index: what columns to return. array of 1 or 0 values, or an int bitmask with bit i selecting column i.
+        # Returns a list of Record objects upon success
+        # Assume that select will never be called on a key that doesn't exist
+        self.select = table.select
+
+        # Read matching records for each search key in a batch:
+        # select_many(search_keys, search_key_index, projected_columns_index)
+        # Returns a list holding the select result (a list of Records) for each search key
+        self.select_many = table.select_many
+
+        # Read every live record in the table, walking the base pages in RID order:
+        # scan_all(projected_columns_index)
+        # Returns a list of Record objects
+        self.scan_all = table.scan_all
+
+        # Update a record with specified key and columns: update(primary_key, *columns)
+        # Returns True if update is succesful
+        # Returns False if no records exist with given key
+        self.update = table.update
+
+        # Update a batch of records, pairing each primary key with its list of columns:
+        # update_many(primary_keys, columns)
+        # Returns a list with the update result for each key
+        # Raises ValueError, updating nothing, if the lists differ in length or a
+        # list of columns does not have one value per column
+        self.update_many = table.update_many
+
+        # Sum one column over a primary key range:
+        # sum(start_range, end_range, aggregate_column_index)
+        # Returns the summation of the given range
+        self.sum = table.sum
 
     
     """
@@ -58,27 +83,6 @@ class Query:
         pass
 
     
-    """
-    # Update a record with specified key and columns
-    # Returns True if update is succesful
-    # Returns False if no records exist with given key or if the target record cannot be accessed due to 2PL locking
-    """
-    def update(self, primary_key, *columns):
-        return self.table.update(primary_key, columns)
-
-    
-    """
-    :param start_range: int         # Start of the key range to aggregate 
-    :param end_range: int           # End of the key range to aggregate 
-    :param aggregate_columns: int  # Index of desired column to aggregate
-    # this function is only called on the primary key.
-    # Returns the summation of the given range upon success
-    # Returns False if no record exists in the given range
-    """
-    def sum(self, start_range, end_range, aggregate_column_index):
-        return self.table.sum(start_range, end_range, aggregate_column_index)
-
-    
     """
     :param start_range: int         # Start of the key range to aggregate 
     :param end_range: int           # End of the key range to aggregate 
@@ -1,5 +1,6 @@
 from lstore.db import Database
 from lstore.query import Query
+from bench_utils import FIRST_FOUR_COLUMNS
 
 from random import choice, randint, sample, seed
 import shutil
@@ -14,62 +15,54 @@ db.open('./lulzz')
 
 grades_table = db.create_table('lolzz', 4, 0)
 query = Query(grades_table)
-records = {}
+ncols = grades_table.num_columns
+# keys are dense and ascending, so a range stands in for the key list
+keys = range(0, 600)
+rows = []
 
-for i in range(0, 600):
-    key = i
-    records[key] = [key, randint(0, 10), randint(0, 10), randint(0, 10)]
-    query.insert(*records[key])
+for key in keys:
+    rows.append([key, randint(0, 10), randint(0, 10), randint(0, 10)])
+query.insert_many(rows)
 
-keys = sorted(list(records.keys()))
 print("Insert finished")
 
-for key in keys:
-    record = query.select(key, 0, [1, 1, 1, 1])[0]
-    error = False
-    for i, column in enumerate(record.columns):
-        if column != records[key][i]:
-            error = True
+for key, row in zip(keys, rows):
+    record = query.select(key, 0, FIRST_FOUR_COLUMNS)[0]
+    error = record.columns != row
     if error:
-        print('select error on', key, ':', record, ', correct:', records[key])
+        print('select error on', key, ':', record, ', correct:', row)
     else:
         pass
         # print('select on', key, ':', record)
 print("Select finished")
 
-for key in keys:
+for key, row in zip(keys, rows):
     updated_columns = [None, None, None, None]
-    for i in range(2, grades_table.num_columns):
+    for i in range(2, ncols):
         # updated value
         value = randint(0, 10)
         updated_columns[i] = value
         # copy record to check
-        original = records[key].copy()
+        original = row.copy()
         # update our test directory
-        records[key][i] = value
+        row[i] = value
         query.update(key, *updated_columns)
-        record = query.select(key, 0, [1, 1, 1, 1])[0]
-        error = False
-        for j, column in enumerate(record.columns):
-            if column != records[key][j]:
-                error = True
+        record = query.select(key, 0, FIRST_FOUR_COLUMNS)[0]
+        error = record.columns != row
         if error:
             print('update error on', original, 'and', updated_columns,
-                  ':', record, ', correct:', records[key])
+                  ':', record, ', correct:', row)
         else:
             pass
             # print('update on', original, 'and', updated_columns, ':', record)
         updated_columns[i] = None
 print("Update finished")
 
-for key in keys:
-    record = query.select(key, 0, [1, 1, 1, 1])[0]
-    error = False
-    for i, column in enumerate(record.columns):
-        if column != records[key][i]:
-            error = True
+for key, row in zip(keys, rows):
+    record = query.select(key, 0, FIRST_FOUR_COLUMNS)[0]
+    error = record.columns != row
     if error:
-        print('select error on', key, ':', record, ', correct:', records[key])
+        print('select error on', key, ':', record, ', correct:', row)
     else:
         pass
         # print('select on', key, ':', record)
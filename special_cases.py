@@ -1,5 +1,6 @@
 from lstore.db import Database
 from lstore.query import Query
+from bench_utils import FIRST_FOUR_COLUMNS
 from time import sleep
 from random import choice, randint, sample, seed
 
@@ -35,13 +36,13 @@ print("Insert finished")
 
 # test 3: select that returns multiple records
 for key in records:
-    record = query.select(key, 0, [1, 1, 1, 1])
+    record = query.select(key, 0, FIRST_FOUR_COLUMNS)
     print('select on', key, ':', [x.columns for x in record])
 print('test 3 finished')
 
 # test 4: select that returns no records
 for key in records:
-    record = query.select(key, 5, [1, 1, 1, 1])
+    record = query.select(key, 5, FIRST_FOUR_COLUMNS)
     print('select on', key, ': ', [x.columns for x in record])
 print('test 4 finished')
 
@@ -52,6 +53,6 @@ print('test 5 finished')
 # test 6: THE GIGA INSERT QUERY
 for _ in range(100000):
     query.insert(*[key, 69, 420, 69, 420])
-print(query.select(420, 2, [1, 1, 1, 1,]))
+print(query.select(420, 2, FIRST_FOUR_COLUMNS))
 print('GIGA INSERT FINISHED')
 db.close()
@@ -1,7 +1,8 @@
 from lstore.db import Database
 from lstore.query import Query
-from time import process_time
-from random import choice, randrange
+from time import perf_counter_ns
+from random import choice, choices, randrange
+from bench_utils import ALL_COLUMNS, make_update_cols
 
 # Student Id and 4 grades
 db = Database()
@@ -9,48 +10,45 @@ grades_table = db.create_table('Grades', 5, 0)
 query = Query(grades_table)
 keys = []
 
-insert_time_0 = process_time()
+insert_time_0 = perf_counter_ns()
 for i in range(0, 10000):
     query.insert(906659671 + i, 93, 0, 0, 0)
     keys.append(906659671 + i)
-insert_time_1 = process_time()
+insert_time_1 = perf_counter_ns()
 
-print("Inserting 10k records took:  \t\t\t", insert_time_1 - insert_time_0)
+print("Inserting 10k records took:  \t\t\t", (insert_time_1 - insert_time_0) / 1e9)
 
 # Measuring update Performance
-update_cols = [
-    [None, None, None, None, None],
-    [None, randrange(0, 100), None, None, None],
-    [None, None, randrange(0, 100), None, None],
-    [None, None, None, randrange(0, 100), None],
-    [None, None, None, None, randrange(0, 100)],
-]
-
-update_time_0 = process_time()
-for i in range(0, 10000):
-    query.update(choice(keys), *(choice(update_cols)))
-update_time_1 = process_time()
-print("Updating 10k records took:  \t\t\t", update_time_1 - update_time_0)
+update_cols = make_update_cols(5)
+
+update_keys = choices(keys, k=10000)
+update_values = choices(update_cols, k=10000)
+
+update_time_0 = perf_counter_ns()
+for key, columns in zip(update_keys, update_values):
+    query.update(key, *columns)
+update_time_1 = perf_counter_ns()
+print("Updating 10k records took:  \t\t\t", (update_time_1 - update_time_0) / 1e9)
 
 # Measuring Select Performance
-select_time_0 = process_time()
+select_time_0 = perf_counter_ns()
 for i in range(0, 10000):
-    query.select(choice(keys), 0, [1, 1, 1, 1, 1])
-select_time_1 = process_time()
-print("Selecting 10k records took:  \t\t\t", select_time_1 - select_time_0)
+    query.select(choice(keys), 0, ALL_COLUMNS)
+select_time_1 = perf_counter_ns()
+print("Selecting 10k records took:  \t\t\t", (select_time_1 - select_time_0) / 1e9)
 
 # Measuring Aggregate Performance
-agg_time_0 = process_time()
+agg_time_0 = perf_counter_ns()
 for i in range(0, 10000, 100):
     start_value = 906659671 + i
     end_value = start_value + 100
     result = query.sum(start_value, end_value - 1, randrange(0, 5))
-agg_time_1 = process_time()
-print("Aggregate 10k of 100 record batch took:\t", agg_time_1 - agg_time_0)
+agg_time_1 = perf_counter_ns()
+print("Aggregate 10k of 100 record batch took:\t", (agg_time_1 - agg_time_0) / 1e9)
 
 # Measuring Delete Performance
-delete_time_0 = process_time()
+delete_time_0 = perf_counter_ns()
 for i in range(0, 10000):
     query.delete(906659671 + i)
-delete_time_1 = process_time()
-print("Deleting 10k records took:  \t\t\t", delete_time_1 - delete_time_0)
+delete_time_1 = perf_counter_ns()
+print("Deleting 10k records took:  \t\t\t", (delete_time_1 - delete_time_0) / 1e9)